@@ -1,8 +1,224 @@
+import copy
+import functools
+import math
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.transforms import Bbox
 from matplotlib.widgets import Button, Slider, RadioButtons, TextBox
 import sympy as sp
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional, without it compute_fractal uses the NumPy loop
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    from numba import cuda
+    HAVE_CUDA = cuda.is_available()
+except ImportError:
+    HAVE_CUDA = False
+
+
+# Tile edge for the NumPy fallback, a 64x64 tile of float64 state fits in L2
+TILE = 64
+
+# Rows per Numba kernel launch, a superseded background render stops between bands
+BAND = 32
+
+# Iterations between compactions of the NumPy fallback's active set
+COMPACT_EVERY = 8
+
+
+@njit(fastmath=True, cache=True, inline='always')
+def _in_main_bulbs(x, y):
+    # Closed-form test for the main cardioid and the period-2 bulb of the
+    # Mandelbrot set, points inside never escape. Works on scalars and arrays.
+    xm = x - 0.25
+    q = xm * xm + y * y
+    xp = x + 1.0
+    return (q * (q + xm) <= 0.25 * y * y) | (xp * xp + y * y <= 0.0625)
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _mandel_kernel(xmin, dx, ymin, dy, max_iter, r2, out):
+    rows, cols = out.shape
+    for i in prange(rows):
+        ci = ymin + i * dy
+        for j in range(cols):
+            cr = xmin + j * dx
+            if _in_main_bulbs(cr, ci):
+                out[i, j] = max_iter
+                continue
+            zr = 0.0
+            zi = 0.0
+            zr2 = 0.0
+            zi2 = 0.0
+            n = 0
+            while n < max_iter:
+                zi = 2.0 * zr * zi + ci
+                zr = zr2 - zi2 + cr
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 > r2:
+                    break
+                n += 1
+            out[i, j] = n
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _julia_kernel(xmin, dx, ymin, dy, max_iter, r2, cr, ci, out):
+    rows, cols = out.shape
+    for i in prange(rows):
+        y = ymin + i * dy
+        for j in range(cols):
+            zr = xmin + j * dx
+            zi = y
+            zr2 = zr * zr
+            zi2 = zi * zi
+            n = 0
+            while n < max_iter:
+                zi = 2.0 * zr * zi + ci
+                zr = zr2 - zi2 + cr
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 > r2:
+                    break
+                n += 1
+            out[i, j] = n
+
+
+if HAVE_CUDA:
+    # One GPU thread per pixel, threads are laid out as (column, row)
+    _in_main_bulbs_gpu = cuda.jit(device=True)(_in_main_bulbs.py_func)
+
+    @cuda.jit
+    def _mandel_gpu(xmin, dx, ymin, dy, max_iter, r2, out):
+        j, i = cuda.grid(2)
+        if i >= out.shape[0] or j >= out.shape[1]:
+            return
+        cr = xmin + j * dx
+        ci = ymin + i * dy
+        if _in_main_bulbs_gpu(cr, ci):
+            out[i, j] = max_iter
+            return
+        zr = 0.0
+        zi = 0.0
+        zr2 = 0.0
+        zi2 = 0.0
+        n = 0
+        while n < max_iter:
+            zi = 2.0 * zr * zi + ci
+            zr = zr2 - zi2 + cr
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > r2:
+                break
+            n += 1
+        out[i, j] = n
+
+    @cuda.jit
+    def _julia_gpu(xmin, dx, ymin, dy, max_iter, r2, cr, ci, out):
+        j, i = cuda.grid(2)
+        if i >= out.shape[0] or j >= out.shape[1]:
+            return
+        zr = xmin + j * dx
+        zi = ymin + i * dy
+        zr2 = zr * zr
+        zi2 = zi * zi
+        n = 0
+        while n < max_iter:
+            zi = 2.0 * zr * zi + ci
+            zr = zr2 - zi2 + cr
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > r2:
+                break
+            n += 1
+        out[i, j] = n
+
+
+def _escape_time_numpy(x, y, julia_c, max_iter, r2, out):
+    # NumPy escape-time loop for one tile, julia_c is None for Mandelbrot
+    X, Y = np.meshgrid(x, y)
+    iters = np.full(X.size, max_iter, dtype=out.dtype)
+    # Real and imaginary parts live in separate flat float64 arrays,
+    # idx maps the compacted state arrays back to positions in iters
+    if julia_c is None:
+        cr, ci = X.ravel(), Y.ravel()
+        # Main cardioid and period-2 bulb points keep max_iter untouched
+        idx = np.flatnonzero(~_in_main_bulbs(cr, ci))
+        cr, ci = cr[idx], ci[idx]
+        zr = np.zeros_like(cr)
+        zi = np.zeros_like(ci)
+    else:
+        cr, ci = julia_c.real, julia_c.imag
+        zr, zi = X.ravel(), Y.ravel()
+        idx = np.arange(zr.size)
+    active = np.ones(zr.size, dtype=bool)
+    escaped = np.empty_like(active)
+    zr2 = zr * zr
+    zi2 = zi * zi
+    mag = np.empty_like(zr)
+    tmp = np.empty_like(zr)
+    for k in range(max_iter):
+        # zi = 2*zr*zi + ci, zr = zr^2 - zi^2 + cr, only for active points
+        np.multiply(zr, zi, out=tmp)
+        tmp *= 2.0
+        tmp += ci
+        np.copyto(zi, tmp, where=active)
+        np.subtract(zr2, zi2, out=tmp)
+        tmp += cr
+        np.copyto(zr, tmp, where=active)
+        # The squares are reused by the next step
+        np.multiply(zr, zr, out=zr2)
+        np.multiply(zi, zi, out=zi2)
+        np.add(zr2, zi2, out=mag)
+        np.greater(mag, r2, out=escaped)
+        escaped &= active
+        iters[idx[escaped]] = k
+        active ^= escaped
+        remaining = np.count_nonzero(active)
+        if remaining == 0:
+            break
+        if k % COMPACT_EVERY == COMPACT_EVERY - 1 and remaining < active.size:
+            # Drop escaped points so later steps only touch the survivors
+            idx = idx[active]
+            zr, zi, zr2, zi2 = zr[active], zi[active], zr2[active], zi2[active]
+            if julia_c is None:
+                cr, ci = cr[active], ci[active]
+            active = np.ones(remaining, dtype=bool)
+            escaped = np.empty_like(active)
+            mag = np.empty_like(zr)
+            tmp = np.empty_like(zr)
+    out[...] = iters.reshape(out.shape)
+
+
+def _bilinear(img, rows, cols):
+    # Sample img at fractional row and column indices, clamped to the edges
+    h, w = img.shape
+    rows = np.clip(rows, 0, h - 1)
+    cols = np.clip(cols, 0, w - 1)
+    r0 = np.minimum(rows.astype(int), max(h - 2, 0))
+    c0 = np.minimum(cols.astype(int), max(w - 2, 0))
+    r1 = np.minimum(r0 + 1, h - 1)
+    c1 = np.minimum(c0 + 1, w - 1)
+    fr = (rows - r0)[:, None]
+    fc = (cols - c0)[None, :]
+    top = img[r0][:, c0] * (1 - fc) + img[r0][:, c1] * fc
+    bottom = img[r1][:, c0] * (1 - fc) + img[r1][:, c1] * fc
+    return top * (1 - fr) + bottom * fr
+
+
 class FractalExplorer:
     def __init__(self):
         # Default paramters for rendring
@@ -14,7 +230,28 @@ class FractalExplorer:
         self.color_style = 'viridis'
         self.frac_type = 'mandelbrot'
         self.julia_c = complex(-0.7, 0.27)
-        
+        # Pixel buffers (iters, norm_iters) and the CUDA device buffer,
+        # reused across renders while pixels is unchanged
+        self._bufs = None
+        self._d_iters = None
+        # Last rendered iters and its view, used for instant zoom previews
+        self._last_iters = None
+        self._last_xrange = None
+        self._last_yrange = None
+        # Background renders: the lock serialises Numba parallel launches and
+        # the CUDA device buffer, results from an older generation are dropped.
+        # _superseded is replaced on background snapshots to stop them early.
+        self._compute_lock = threading.Lock()
+        self._superseded = lambda: False
+        self._render_gen = 0
+        self._render_thread = None
+        self._results = queue.Queue()
+        # Image artist created by the first render and updated in place after
+        self._im = None
+        # Saved pixels behind the image and title for blitted Julia updates
+        self._background = None
+        # (key, (formula, desc)) from the last symbolic_representation call
+        self._symbolic = None
         
         self.setup_plot()
         
@@ -24,7 +261,13 @@ class FractalExplorer:
         self.fig = plt.figure(figsize=(16/1.33, 9/1.5))
         self.fig.patch.set_facecolor('#121212')
         
-        
+        # Single-shot timer so a burst of slider events triggers one render
+        self._render_timer = self.fig.canvas.new_timer(interval=80)
+        self._render_timer.single_shot = True
+        self._render_timer.add_callback(self.render_fractal)
+        # Polls for the result of a background render on the GUI thread
+        self._poll_timer = self.fig.canvas.new_timer(interval=20)
+        self._poll_timer.add_callback(self._poll_background)
        
         self.ax = self.fig.add_axes([0.1, 0.15, 0.65, 0.80])
         self.ax.set_title(f"{self.frac_type.capitalize()} Set", color='white')
@@ -38,6 +281,7 @@ class FractalExplorer:
         # Conect mouse events
         self.fig.canvas.mpl_connect('button_press_event', self.on_click)
         self.fig.canvas.mpl_connect('button_release_event', self.on_release)
+        self.fig.canvas.mpl_connect('resize_event', self._invalidate_background)
         self.click_start = None
         
     def setup_controls(self):
@@ -75,7 +319,7 @@ class FractalExplorer:
         
         
         cmap_ax = self.fig.add_axes([0.8, 0.35, 0.15, 0.19])
-        self.color_radio = RadioButtons(cmap_ax, ('vidis', 'plasma', 'magma', 'hot', 'cool'))
+        self.color_radio = RadioButtons(cmap_ax, ('viridis', 'plasma', 'magma', 'hot', 'cool'))
         for txt in self.color_radio.labels:
             txt.set_color('white')
             txt.set_fontsize(10)
@@ -102,43 +346,153 @@ class FractalExplorer:
                                         fontsize=10, color='white')
         self.julia_text.set_visible(self.frac_type == 'julia')
         
-    def mandelbrot_iteration(self, c, max_iter, escape_radius=2.0):
-        z = 0
-        for i in range(max_iter):
-            z = z**2 + c
-            if abs(z) > escape_radius:
-                return i
-        return max_iter
+    def _iters_dtype(self):
+        # iters fits in uint16 for any slider value, int32 beyond that
+        return np.uint16 if self.max_iters <= np.iinfo(np.uint16).max else np.int32
+    
+    def _get_buffers(self):
+        # The log scaling runs in float32 and the image gets 8-bit levels
+        dtype = self._iters_dtype()
+        if (self._bufs is None or self._bufs[0].shape[0] != self.pixels
+                or self._bufs[0].dtype != dtype):
+            shape = (self.pixels, self.pixels)
+            self._bufs = (np.empty(shape, dtype=dtype), np.empty(shape, dtype=np.float32),
+                          np.empty(shape, dtype=np.uint8))
+        return self._bufs
     
-    def julia_iteration(self, z, c, max_iter, escape_radius=2.0):
-        for i in range(max_iter):
-            z = z**2 + c
-            if abs(z) > escape_radius:
-                return i
-        return max_iter
+    def _symmetry(self):
+        # 'flip' when iters(x, y) == iters(x, -y) over the view, 'rotate' when
+        # iters(x, y) == iters(-x, -y), None when the view has no symmetry
+        x0, x1 = self.x_range
+        y0, y1 = self.y_range
+        if abs(y0 + y1) > 1e-12 * (y1 - y0):
+            return None
+        if self.frac_type == 'mandelbrot' or self.julia_c.imag == 0:
+            return 'flip'
+        if abs(x0 + x1) <= 1e-12 * (x1 - x0):
+            return 'rotate'
+        return None
+    
+    def effective_iters(self):
+        # Shallow views look the same with far fewer iterations, so the budget
+        # starts at 60 and grows with the zoom depth, capped by the slider
+        zoom = 4.0 / max(self.x_range[1] - self.x_range[0], 1e-12)
+        budget = int(60 + 30 * math.log2(max(zoom, 1.0)))
+        return min(self.max_iters, budget)
     
     def compute_fractal(self):
-        x = np.linspace(self.x_range[0], self.x_range[1], self.pixels)
-        y = np.linspace(self.y_range[0], self.y_range[1], self.pixels)
-        X, Y = np.meshgrid(x, y)
-        Z = X + 1j * Y
-        iters = np.zeros(Z.shape, dtype=int)
-        if self.frac_type == 'mandelbrot':
-            for i in range(iters.shape[0]):
-                for j in range(iters.shape[1]):
-                    iters[i, j] = self.mandelbrot_iteration(Z[i, j], self.max_iters, self.escape_val)
+        iters = self._get_buffers()[0]
+        dx = (self.x_range[1] - self.x_range[0]) / (self.pixels - 1) if self.pixels > 1 else 0.0
+        dy = (self.y_range[1] - self.y_range[0]) / (self.pixels - 1) if self.pixels > 1 else 0.0
+        # Only the upper half is computed when the lower half is its mirror image
+        mirror = self._symmetry()
+        lo = self.pixels // 2 if mirror else 0
+        ymin = self.y_range[0] + lo * dy
+        max_iter = self.effective_iters()
+        # Kernels compare zr*zr + zi*zi against the squared radius, no sqrt
+        r2 = self.escape_val * self.escape_val
+        if HAVE_CUDA:
+            self._compute_rows_cuda(dx, ymin, dy, lo, max_iter, r2, iters[lo:])
+        elif HAVE_NUMBA:
+            self._compute_rows_numba(dx, ymin, dy, max_iter, r2, iters[lo:])
         else:
-            for i in range(iters.shape[0]):
-                for j in range(iters.shape[1]):
-                    iters[i, j] = self.julia_iteration(Z[i, j], self.julia_c, self.max_iters, self.escape_val)
+            self._compute_rows_numpy(dx, ymin, dy, max_iter, r2, iters[lo:])
+        if mirror == 'flip':
+            iters[:lo] = iters[self.pixels - lo:][::-1]
+        elif mirror == 'rotate':
+            iters[:lo] = iters[self.pixels - lo:][::-1, ::-1]
         return iters
     
+    def _compute_rows_numba(self, dx, ymin, dy, max_iter, r2, out):
+        for r in range(0, out.shape[0], BAND):
+            if self._superseded():
+                return
+            band = out[r:r + BAND]
+            # Numba's workqueue threading layer cannot run two parallel kernels at once
+            with self._compute_lock:
+                if self.frac_type == 'mandelbrot':
+                    _mandel_kernel(self.x_range[0], dx, ymin + r * dy, dy, max_iter, r2, band)
+                else:
+                    _julia_kernel(self.x_range[0], dx, ymin + r * dy, dy, max_iter, r2,
+                                  self.julia_c.real, self.julia_c.imag, band)
+    
+    def _compute_rows_cuda(self, dx, ymin, dy, lo, max_iter, r2, out):
+        if self._superseded():
+            return
+        # The device buffer is shared with background snapshots
+        with self._compute_lock:
+            self._launch_cuda(dx, ymin, dy, lo, max_iter, r2, out)
+    
+    def _launch_cuda(self, dx, ymin, dy, lo, max_iter, r2, out):
+        shape = (self.pixels, self.pixels)
+        if (self._d_iters is None or self._d_iters.shape != shape
+                or self._d_iters.dtype != out.dtype):
+            self._d_iters = cuda.device_array(shape, dtype=out.dtype)
+        d_out = self._d_iters[lo:]
+        threads = (16, 16)
+        blocks = ((out.shape[1] + threads[0] - 1) // threads[0],
+                  (out.shape[0] + threads[1] - 1) // threads[1])
+        if self.frac_type == 'mandelbrot':
+            _mandel_gpu[blocks, threads](self.x_range[0], dx, ymin, dy, max_iter, r2, d_out)
+        else:
+            _julia_gpu[blocks, threads](self.x_range[0], dx, ymin, dy, max_iter, r2,
+                                       self.julia_c.real, self.julia_c.imag, d_out)
+        d_out.copy_to_host(out)
+    
+    def _compute_rows_numpy(self, dx, ymin, dy, max_iter, r2, out):
+        rows, cols = out.shape
+        x = self.x_range[0] + np.arange(cols) * dx
+        y = ymin + np.arange(rows) * dy
+        julia_c = None if self.frac_type == 'mandelbrot' else self.julia_c
+        
+        def tile(ti, tj):
+            if not self._superseded():
+                _escape_time_numpy(x[tj:tj + TILE], y[ti:ti + TILE], julia_c,
+                                   max_iter, r2, out[ti:ti + TILE, tj:tj + TILE])
+        
+        # Each tile runs to completion while its working set stays in cache,
+        # ufuncs release the GIL so tiles spread over the thread pool
+        with ThreadPoolExecutor() as pool:
+            futures = [pool.submit(tile, ti, tj)
+                       for ti in range(0, rows, TILE)
+                       for tj in range(0, cols, TILE)]
+            for future in futures:
+                future.result()
+    
     def render_fractal(self):
-        self.ax.clear()
+        # A synchronous render supersedes any background render in flight
+        self._render_gen += 1
         iters = self.compute_fractal()
-        norm_iters = np.log(iters + 1) / np.log(self.max_iters + 1)
-        self.ax.imshow(norm_iters, extent=[self.x_range[0], self.x_range[1], self.y_range[0], self.y_range[1]], 
-                       cmap=self.color_style, origin='lower', interpolation='bilinear')
+        self._last_iters = iters.copy()
+        self._last_xrange, self._last_yrange = self.x_range, self.y_range
+        self.draw_iters(iters)
+    
+    def draw_iters(self, iters):
+        self._set_image(iters)
+        # A full redraw may move or restyle the axes, so the blit cache is stale
+        self._background = None
+        self.fig.canvas.draw_idle()
+    
+    def _set_image(self, iters):
+        _, scaled, norm_iters = self._get_buffers()
+        # Scale to 0..255 with a scalar factor, then round while casting to 8 bits.
+        # The clip keeps counts above the budget (zoom previews) from wrapping.
+        np.log1p(iters, out=scaled)
+        scaled *= np.float32(255.0 / math.log1p(self.effective_iters()))
+        np.minimum(scaled, np.float32(255.0), out=scaled)
+        np.add(scaled, np.float32(0.5), out=norm_iters, casting='unsafe')
+        extent = [self.x_range[0], self.x_range[1], self.y_range[0], self.y_range[1]]
+        if self._im is None:
+            self._im = self.ax.imshow(norm_iters, extent=extent, cmap=self.color_style,
+                                      origin='lower', interpolation='bilinear')
+        else:
+            # Update the existing image instead of rebuilding the axes
+            self._im.set_data(norm_iters)
+            self._im.set_extent(extent)
+            self._im.set_cmap(self.color_style)
+            self._im.set_clim(norm_iters.min(), norm_iters.max())
+            self.ax.set_xlim(extent[0], extent[1])
+            self.ax.set_ylim(extent[2], extent[3])
         title = f"{self.frac_type.capitalize()} Set"
         if self.frac_type == 'julia':
             title += f" (c = {self.julia_c})"
@@ -146,22 +500,112 @@ class FractalExplorer:
         self.coord_text.set_text(f"View: x={self.x_range}, y={self.y_range}")
         self.julia_text.set_visible(self.frac_type == 'julia')
         self.julia_text.set_text(f"Julia constant: {self.julia_c}")
-        plt.draw()
+    
+    def render_julia(self):
+        # Only the image, the title and julia_text change with the Julia
+        # constant, so they are blitted over a cached background
+        canvas = self.fig.canvas
+        if not getattr(canvas, 'supports_blit', False):
+            self.render_fractal()
+            return
+        self._render_gen += 1
+        iters = self.compute_fractal()
+        self._last_iters = iters.copy()
+        self._last_xrange, self._last_yrange = self.x_range, self.y_range
+        self._set_image(iters)
+        # The axes slot up to the top of the figure, which holds the title and
+        # julia_text but none of the controls, padded to cover the spines
+        pos = self.ax.get_position(original=True)
+        bbox = Bbox.from_extents(pos.x0, pos.y0, pos.x1, 1.0)
+        bbox = bbox.transformed(self.fig.transFigure).padded(2)
+        artists = (self._im, *self.ax.spines.values(), self.ax.title, self.julia_text)
+        if self._background is None:
+            for artist in artists:
+                artist.set_animated(True)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(bbox)
+            for artist in artists:
+                artist.set_animated(False)
+        canvas.restore_region(self._background)
+        for artist in artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(bbox)
+    
+    def _invalidate_background(self, event):
+        self._background = None
+    
+    def preview_zoom(self):
+        # Resample the last render into the current view while the real one runs
+        if self._last_iters is None:
+            return
+        h, w = self._last_iters.shape
+        lx0, lx1 = self._last_xrange
+        ly0, ly1 = self._last_yrange
+        x = np.linspace(self.x_range[0], self.x_range[1], self.pixels)
+        y = np.linspace(self.y_range[0], self.y_range[1], self.pixels)
+        cols = (x - lx0) / (lx1 - lx0) * (w - 1)
+        rows = (y - ly0) / (ly1 - ly0) * (h - 1)
+        self.draw_iters(_bilinear(self._last_iters, rows, cols))
+    
+    def _view_key(self):
+        # Everything compute_fractal reads, a background result is only drawn
+        # while this still matches the explorer
+        return (self.pixels, self.x_range, self.y_range, self.max_iters, self.escape_val,
+                self.frac_type, self.julia_c)
+    
+    def render_in_background(self):
+        self._render_gen += 1
+        gen = self._render_gen
+        # The worker computes from a snapshot taken here on the GUI thread, with
+        # its own iters array, so later GUI changes cannot reach it. The
+        # snapshot stops early once a newer render has started.
+        view = copy.copy(self)
+        view._bufs = (np.empty((self.pixels, self.pixels), dtype=self._iters_dtype()), None, None)
+        view._superseded = lambda: gen != self._render_gen
+        self._render_thread = threading.Thread(target=self._background_compute,
+                                               args=(view, gen), daemon=True)
+        self._render_thread.start()
+        self._poll_timer.start()
+    
+    def _background_compute(self, view, gen):
+        iters = view.compute_fractal()
+        if not view._superseded():
+            self._results.put((gen, view._view_key(), iters))
+    
+    def _poll_background(self):
+        done = not self._render_thread.is_alive()
+        while True:
+            try:
+                gen, key, iters = self._results.get_nowait()
+            except queue.Empty:
+                break
+            # Drop results superseded by a newer render or a changed view
+            if gen == self._render_gen and key == self._view_key():
+                self._last_iters = iters
+                self._last_xrange, self._last_yrange = self.x_range, self.y_range
+                self.draw_iters(iters)
+        if done:
+            self._poll_timer.stop()
+    
+    def schedule_render(self):
+        # Restart the debounce timer, only the last call within 80 ms renders
+        self._render_timer.stop()
+        self._render_timer.start()
     
     def update_iterations(self, val):
         self.max_iters = int(val)
-        self.render_fractal()
+        self.schedule_render()
     
     def update_escape_value(self, val):
         self.escape_val = float(val)
-        self.render_fractal()
+        self.schedule_render()
     
     def update_pixels(self, text):
         try:
             val = int(text)
             if val > 0:
                 self.pixels = val
-                self.render_fractal()
+                self.schedule_render()
             else:
                 print("Pixel value must be > 0.")
         except ValueError:
@@ -172,15 +616,17 @@ class FractalExplorer:
         self.render_fractal()
     
     def change_fractal_type(self, label):
-        self.frac_type = label
-        if label == 'mandelbrot':
+        # Radio labels are capitalised, frac_type is compared in lowercase
+        self.frac_type = label.lower()
+        if self.frac_type == 'mandelbrot':
+            # reset_view already renders
             self.reset_view(None)
         else:
             if hasattr(self, 'last_click_pos') and self.frac_type == 'julia':
                 x, y = self.last_click_pos
                 self.julia_c = complex(x, y)
                 self.julia_text.set_text(f"Julia constant: {self.julia_c}")
-        self.render_fractal()
+            self.render_fractal()
     
     def on_click(self, event):
         if event.inaxes == self.ax:
@@ -189,7 +635,7 @@ class FractalExplorer:
             if event.button == 3 and self.frac_type == 'julia':
                 self.julia_c = complex(event.xdata, event.ydata)
                 self.julia_text.set_text(f"Julia constant: {self.julia_c}")
-                self.render_fractal()
+                self.render_julia()
     
     def on_release(self, event):
         if event.inaxes == self.ax and self.click_start:
@@ -199,9 +645,12 @@ class FractalExplorer:
                 if abs(x_end - x_start) > 0.01 or abs(y_end - y_start) > 0.01:
                     x_min, x_max = min(x_start, x_end), max(x_start, x_end)
                     y_min, y_max = min(y_start, y_end), max(y_start, y_end)
-                    self.x_range = (x_min, x_max)
-                    self.y_range = (y_min, y_max)
-                    self.render_fractal()
+                    # A purely horizontal or vertical drag has no area to zoom into
+                    if x_max > x_min and y_max > y_min:
+                        self.x_range = (x_min, x_max)
+                        self.y_range = (y_min, y_max)
+                        self.preview_zoom()
+                        self.render_in_background()
                 elif self.frac_type == 'mandelbrot':
                     self.julia_c = complex(x_start, y_start)
                     self.julia_text.set_text(f"Julia constant: {self.julia_c}")
@@ -218,7 +667,7 @@ class FractalExplorer:
         self.render_fractal()
     
     def save_image(self, event):
-        filename = f"{self.frac_type}_{self.color_style}_{self.max_iters}.png"
+        filename = f"{self.frac_type}_{self.color_style}_{self.effective_iters()}.png"
         plt.savefig(filename, dpi=300, bbox_inches='tight')
         print(f"Image saved as {filename}")
     
@@ -226,6 +675,10 @@ class FractalExplorer:
         plt.show()
     
     def symbolic_representation(self):
+        # Only rebuilt when the fractal type or the Julia constant changes
+        key = (self.frac_type, self.julia_c)
+        if self._symbolic is not None and self._symbolic[0] == key:
+            return self._symbolic[1]
         z, c = sp.symbols('z c')
         if self.frac_type == 'mandelbrot':
             formula = z**2 + c
@@ -234,8 +687,12 @@ class FractalExplorer:
             c_val = self.julia_c
             formula = z**2 + c_val
             desc = f"Julia set: iterating z = z² + c where c = {c_val}."
+        self._symbolic = (key, (formula, desc))
         return formula, desc
 
+# sp.solve is slow and sympy expressions are hashable, so results are
+# memoised per (formula, var_name)
+@functools.lru_cache(maxsize=128)
 def analyze_fractal_formula(formula, var_name='z'):
     z = sp.Symbol(var_name)
     derivative = sp.diff(formula, z)